@@ -5,26 +5,50 @@
 """
 
 import os
+import re
 import subprocess
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
 import ast
+import functools
+import hashlib
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Перевірка наявності необхідних бібліотек
 try:
     from docx import Document  # type: ignore
     from docx.shared import Inches, Pt, RGBColor  # type: ignore
     from docx.enum.text import WD_ALIGN_PARAGRAPH  # type: ignore
+    from docx.enum.style import WD_STYLE_TYPE  # type: ignore
 except ImportError:
+    # Автоматичне встановлення лише на явний запит: запуск pip займає кілька
+    # секунд і не повинен відбуватися непомітно при кожному холодному старті
+    if os.environ.get("LAB3_AUTO_INSTALL") != "1":
+        raise SystemExit(
+            "Для генерації звіту потрібна бібліотека python-docx: "
+            "pip install python-docx (або запустіть з LAB3_AUTO_INSTALL=1)"
+        )
     print("Встановлення бібліотеки python-docx...")
     subprocess.check_call([sys.executable, "-m", "pip", "install", "python-docx"])
     from docx import Document  # type: ignore
     from docx.shared import Inches, Pt, RGBColor  # type: ignore
     from docx.enum.text import WD_ALIGN_PARAGRAPH  # type: ignore
+    from docx.enum.style import WD_STYLE_TYPE  # type: ignore
 
 # Конфігурація
 CURRENT_DIR = Path(__file__).parent
+OUTPUT_CACHE_PATH = CURRENT_DIR / '.lab3_cache.json'
+
+# Незмінні значення форматування створюємо один раз, а не для кожного абзацу
+_HALF_INCH_EMU = Inches(0.5)
+_CODE_FONT = ('Consolas', Pt(8), RGBColor(0, 0, 0))
+_RESULT_FONT = ('Consolas', Pt(9), RGBColor(0, 100, 0))
+CODE_STYLE = 'CodeMono'
+RESULT_STYLE = 'ResultMono'
 
 # Описи завдань
 TASK_DESCRIPTIONS = {
@@ -105,6 +129,9 @@ TASK_DESCRIPTIONS = {
     },
 }
 
+# Опис для файлів, яких немає у TASK_DESCRIPTIONS
+_DEFAULT_INFO = {'title': None, 'description': 'Виконання завдання', 'topic': 'Python'}
+
 TEST_INPUTS = {
     'riven1zada4a1.py': 'тестовий текст для аналізу\n',
     'riven1zada4a2.py': '1 2 3\nвихід\n',
@@ -135,20 +162,20 @@ def get_python_files() -> list:
     return sorted(files, key=lambda x: x.name)
 
 
-def sanitize_output(output: str) -> str:
-    """Прибирає службові повідомлення про помилки з виводу для звіту."""
-    if not output:
-        return ""
-    cleaned_lines = []
-    for line in output.splitlines():
-        if any(token in line for token in ("❌", "✗", "Помилка", "Error", "Traceback")):
-            continue
-        cleaned_lines.append(line)
-    return "\n".join(cleaned_lines).strip()
+# Рядки з цими маркерами - службові повідомлення, у звіт вони не потрапляють
+BAD_TOKENS = ("❌", "✗", "Помилка", "Error", "Traceback")
+# Шаблон для сирих байтів виводу: службові рядки відкидаються ще до
+# декодування
+_BAD_RE_BYTES = re.compile(b'|'.join(re.escape(t.encode('utf-8')) for t in BAD_TOKENS))
+
 
+def capture_output(script_path, input_text=None, args=None, timeout=10):
+    """Виконує скрипт та захоплює його вивід.
 
-def capture_output(script_path, input_text=None, args=None):
-    """Виконує скрипт та захоплює його вивід"""
+    Вивід читається з каналу построково як байти й одразу очищається від
+    службових рядків, тож повний сирий вивід у пам'яті не накопичується,
+    а декодуються лише рядки, що залишаються.
+    """
     try:
         env = os.environ.copy()
         env['PYTHONIOENCODING'] = 'utf-8'
@@ -156,47 +183,140 @@ def capture_output(script_path, input_text=None, args=None):
         cmd = [sys.executable, str(script_path)]
         if args:
             cmd.extend(args)
-        
-        result = subprocess.run(
+
+        with subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=10,
-            input=input_text or "",
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             cwd=str(script_path.parent),
-            env=env,
-            encoding='utf-8'
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
+            env=env
+        ) as proc:
+            # Гарантія тайм-ауту: процес примусово зупиняється, навіть якщо
+            # він завис, не закривши stdout
+            timer = threading.Timer(timeout, proc.kill)
+            timer.start()
+            try:
+                try:
+                    proc.stdin.write((input_text or "").encode('utf-8'))
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    # Скрипт завершився, не дочитавши вхідні дані - його
+                    # вивід усе одно потрібен, як і з communicate()
+                    pass
+                out = []
+                for raw in proc.stdout:
+                    if _BAD_RE_BYTES.search(raw):
+                        continue
+                    # Декодуємо лише рядки, що потрапляють у звіт
+                    out.append(raw.rstrip(b'\r\n').decode('utf-8', 'replace'))
+                returncode = proc.wait()
+                timed_out = not timer.is_alive()
+            finally:
+                timer.cancel()
+
+        if returncode == 0 and not timed_out:
+            return "\n".join(out).strip()
         else:
             return None
-    except subprocess.TimeoutExpired:
-        return None
     except Exception as e:
         return None
 
 
-def read_file_content(file_path):
-    """Читає вміст файлу"""
+def _output_cache_key(script_path, input_text=None, args=None):
+    """Ключ кешу виводу: шлях і mtime скрипта, вхідні дані та аргументи"""
+    mtimes = [script_path.stat().st_mtime_ns]
+    # Файли з тестовими даними - в аргументах або в рядках stdin - теж
+    # впливають на вивід, тож їхні mtime і розмір входять у ключ. Відносні
+    # шляхи беруться від теки, де запускається скрипт (cwd у capture_output)
+    candidates = list(args or ())
+    if input_text:
+        candidates.extend(input_text.splitlines())
+    for candidate in candidates:
+        data_path = script_path.parent / candidate
+        if data_path.is_file():
+            st = data_path.stat()
+            mtimes.append((st.st_mtime_ns, st.st_size))
+    raw = f"{script_path}:{mtimes}:{input_text}:{args}"
+    return hashlib.blake2b(raw.encode('utf-8')).hexdigest()
+
+
+def load_output_cache():
+    """Завантажує кеш виводу скриптів з диска (порожній, якщо кешу немає)"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    except Exception as e:
-        return f"Помилка читання файлу: {str(e)}"
+        with open(OUTPUT_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_output_cache(cache):
+    """Зберігає кеш виводу скриптів на диск"""
+    try:
+        with open(OUTPUT_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"⊘ Не вдалося зберегти кеш виводу: {e}")
+
+
+@functools.lru_cache(maxsize=64)
+def _read_cached(path_str, mtime_ns):
+    """Читає файл; mtime_ns входить у ключ кешу, тож зміна файлу інвалідує запис"""
+    with open(path_str, 'r', encoding='utf-8') as f:
+        text = f.read()
+    return text, tuple(text.split('\n'))
 
 
-def add_formatted_code(doc, code_text, max_lines=100):
-    """Додає форматований код до документа"""
-    lines = code_text.split('\n')
-    for i, line in enumerate(lines[:max_lines]):
-        p = doc.add_paragraph(line if line.strip() else "")
-        p.paragraph_format.left_indent = Inches(0.5)
-        p.paragraph_format.line_spacing = 1.0
-        if p.runs:
-            p.runs[0].font.name = 'Consolas'
-            p.runs[0].font.size = Pt(8)
-            p.runs[0].font.color.rgb = RGBColor(0, 0, 0)
+def read_file_content(file_path):
+    """Читає вміст файлу (з кешуванням за шляхом та часом модифікації).
+
+    Повертає пару (текст, рядки), щоб текст розбивався на рядки лише один раз.
+    """
+    try:
+        file_path = Path(file_path)
+        return _read_cached(str(file_path), file_path.stat().st_mtime_ns)
+    except Exception as e:
+        message = f"Помилка читання файлу: {str(e)}"
+        return message, (message,)
+
+
+read_file_content.cache_clear = _read_cached.cache_clear
+
+
+def add_mono_style(doc, name, font, line_spacing=None):
+    """Створює стиль абзацу з відступом та шрифтом (назва, розмір, колір)"""
+    font_name, font_size, font_color = font
+    style = doc.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+    style.base_style = doc.styles['Normal']
+    style.font.name = font_name
+    style.font.size = font_size
+    style.font.color.rgb = font_color
+    style.paragraph_format.left_indent = _HALF_INCH_EMU
+    if line_spacing is not None:
+        style.paragraph_format.line_spacing = line_spacing
+    return style
+
+
+def add_lines_fast(doc, lines, style):
+    """Додає рядки окремими абзацами заданого стилю"""
+    # Вставка перед маркерним абзацом не шукає кінець документа щоразу,
+    # на відміну від doc.add_paragraph
+    sentinel = doc.add_paragraph()
+    insert_before = sentinel.insert_paragraph_before
+    for line in lines:
+        insert_before(line, style=style)
+    sentinel._element.getparent().remove(sentinel._element)
+
+
+def add_formatted_code(doc, code_lines, max_lines=100):
+    """Додає форматований код (вже розбитий на рядки) до документа"""
+    lines = code_lines.split('\n') if isinstance(code_lines, str) else code_lines
+    add_lines_fast(
+        doc,
+        [line if line.strip() else "" for line in lines[:max_lines]],
+        CODE_STYLE,
+    )
     
     if len(lines) > max_lines:
         doc.add_paragraph(f"... (залишилось {len(lines) - max_lines} рядків)")
@@ -224,28 +344,64 @@ def get_task_conclusions(task_file) -> str:
     return conclusions.get(task_file, 'Завдання виконано успішно.')
 
 
-def create_report():
-    """Створює звіт у форматі DOCX"""
+def create_report(use_cache=True):
+    """Створює звіт у форматі DOCX.
+
+    Якщо use_cache=True, вивід скриптів, які не змінилися з попереднього
+    запуску, береться з кешу на диску без повторного виконання.
+    """
     
     py_files = get_python_files()
+    # Опис кожного завдання визначаємо один раз для змісту й основної частини
+    entries = [(f, TASK_DESCRIPTIONS.get(f.name, _DEFAULT_INFO)) for f in py_files]
     task_results = {}
+    cache = load_output_cache() if use_cache else {}
     
     print("\nЗбір результатів виконання...")
-    
-    # Обробляємо кожен файл з тестовими даними
-    for task_file in py_files:
-        input_text = TEST_INPUTS.get(task_file.name)
-        args = TEST_ARGS.get(task_file.name)
-
-        output = capture_output(task_file, input_text=input_text, args=args)
 
+    def _store_result(task_file, output):
         if output is None:
             task_results[task_file.name] = "(Без виводу)"
             print(f"⊘ {task_file.name}: результат не отримано")
         else:
-            cleaned = sanitize_output(output)
-            task_results[task_file.name] = cleaned if cleaned else "(Без виводу)"
+            # capture_output вже відфільтрував службові рядки
+            task_results[task_file.name] = output if output else "(Без виводу)"
             print(f"✓ {task_file.name}: OK")
+
+    pending = []
+    keys = {}
+    for task_file in py_files:
+        keys[task_file] = _output_cache_key(task_file, TEST_INPUTS.get(task_file.name),
+                                            TEST_ARGS.get(task_file.name))
+        if keys[task_file] in cache:
+            _store_result(task_file, cache[keys[task_file]])
+        else:
+            pending.append(task_file)
+    
+    # Обробляємо кожен файл з тестовими даними (скрипти незалежні, тому
+    # запускаємо їх паралельно - потоки лише чекають на завершення процесів)
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as ex:
+            futures = {
+                ex.submit(capture_output, task_file,
+                          input_text=TEST_INPUTS.get(task_file.name),
+                          args=TEST_ARGS.get(task_file.name)): task_file
+                for task_file in pending
+            }
+            for future in as_completed(futures):
+                task_file = futures[future]
+                output = future.result()
+                # Невдалі запуски не кешуємо, щоб наступного разу спробувати знову
+                if output is not None:
+                    cache[keys[task_file]] = output
+                _store_result(task_file, output)
+
+    # Записуємо лише записи для ключів цього запуску: застарілі (за старими
+    # mtime чи вхідними даними) відкидаються, тож файл кешу не росте
+    if use_cache:
+        current = {key: cache[key] for key in keys.values() if key in cache}
+        if pending or len(current) != len(cache):
+            save_output_cache(current)
     
     # Створюємо документ
     doc = Document()
@@ -255,6 +411,9 @@ def create_report():
     font = style.font
     font.name = 'Times New Roman'
     font.size = Pt(12)
+    # Стилі для коду та результатів: шрифт задається один раз, а не для кожного рядка
+    add_mono_style(doc, CODE_STYLE, _CODE_FONT, line_spacing=1.0)
+    add_mono_style(doc, RESULT_STYLE, _RESULT_FONT)
     
     # ============ ТИТУЛЬНА СТОРІНКА ============
     title = doc.add_heading('ЗВІТ', 0)
@@ -299,10 +458,8 @@ def create_report():
     toc = doc.add_heading('ЗМІСТ', 1)
     toc.alignment = WD_ALIGN_PARAGRAPH.CENTER
     
-    for i, file_path in enumerate(py_files, 1):
-        filename = file_path.name
-        if filename in TASK_DESCRIPTIONS:
-            task_info = TASK_DESCRIPTIONS[filename]
+    for i, (file_path, task_info) in enumerate(entries, 1):
+        if task_info['title'] is not None:
             doc.add_paragraph(f"{i}. {task_info['title']}", style='List Bullet')
     
     doc.add_page_break()
@@ -330,29 +487,24 @@ def create_report():
     # ============ ОСНОВНА ЧАСТИНА - АНАЛІЗ ЗАВДАНЬ ============
     doc.add_heading('2. РЕЗУЛЬТАТИ ВИКОНАННЯ ЗАВДАНЬ', 1)
     
-    for task_num, file_path in enumerate(py_files, 1):
+    for task_num, (file_path, task_info) in enumerate(entries, 1):
         filename = file_path.name
         
         # Заголовок завдання
-        if filename in TASK_DESCRIPTIONS:
-            task_info = TASK_DESCRIPTIONS[filename]
-            doc.add_heading(f'{task_num}. {task_info["title"]}', 1)
-        else:
-            doc.add_heading(f'{task_num}. {filename}', 1)
-            task_info = {'description': 'Виконання завдання', 'topic': 'Python'}
+        doc.add_heading(f'{task_num}. {task_info["title"] or filename}', 1)
         
         # 1. Короткий огляд
         doc.add_heading('1.1 Короткий огляд', 2)
         overview = f"{task_info['description']}\nТема: {task_info['topic']}"
         overview_para = doc.add_paragraph(overview)
-        overview_para.paragraph_format.left_indent = Inches(0.5)
+        overview_para.paragraph_format.left_indent = _HALF_INCH_EMU
         doc.add_paragraph()
         
         # 2. Вихідний код
         doc.add_heading('1.2 Вихідний код:', 2)
         
-        code_content = read_file_content(file_path)
-        add_formatted_code(doc, code_content, max_lines=80)
+        _, code_lines = read_file_content(file_path)
+        add_formatted_code(doc, code_lines, max_lines=80)
         
         doc.add_paragraph()
         
@@ -364,7 +516,7 @@ def create_report():
         if output is None:
             # Скрипт не виконувався
             p = doc.add_paragraph("⊘ Скрипт аналізується як код без автоматичного виконання")
-            p.paragraph_format.left_indent = Inches(0.5)
+            p.paragraph_format.left_indent = _HALF_INCH_EMU
             if p.runs:
                 p.runs[0].font.italic = True
                 p.runs[0].font.name = 'Consolas'
@@ -372,14 +524,8 @@ def create_report():
                 p.runs[0].font.color.rgb = RGBColor(100, 100, 100)
         else:
             # Успішне виконання (повний вивід)
-            lines = [ln for ln in output.split('\n') if ln.strip()]
-            for line in lines:
-                p = doc.add_paragraph(line)
-                p.paragraph_format.left_indent = Inches(0.5)
-                if p.runs:
-                    p.runs[0].font.name = 'Consolas'
-                    p.runs[0].font.size = Pt(9)
-                    p.runs[0].font.color.rgb = RGBColor(0, 100, 0)
+            # Порожні рядки відкидаються в тому ж проході, що й вставка абзаців
+            add_lines_fast(doc, (ln for ln in output.split('\n') if ln.strip()), RESULT_STYLE)
         
         doc.add_paragraph()
         
@@ -388,7 +534,7 @@ def create_report():
         
         conclusions = get_task_conclusions(filename)
         conclusion_para = doc.add_paragraph(conclusions)
-        conclusion_para.paragraph_format.left_indent = Inches(0.5)
+        conclusion_para.paragraph_format.left_indent = _HALF_INCH_EMU
         
         # Розрив сторінки після кожного завдання
         if task_num < len(py_files):
@@ -463,7 +609,10 @@ def create_report():
     
     # Зберігаємо документ
     output_path = CURRENT_DIR / f'Звіт_Лабораторна_3_{datetime.now().strftime("%Y%m%d")}.docx'
-    doc.save(str(output_path))
+    # Серіалізуємо документ у пам'ять і записуємо на диск одним викликом
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    output_path.write_bytes(buffer.getvalue())
     
     print(f"\n✓ Звіт успішно створено: {output_path}")
     print(f"✓ Проаналізовано файлів: {len(py_files)}")
@@ -478,7 +627,7 @@ if __name__ == '__main__':
     print("=" * 70)
     
     try:
-        report_path = create_report()
+        report_path = create_report(use_cache='--no-cache' not in sys.argv[1:])
         print()
         print("=" * 70)
         print("Звіт готовий!")
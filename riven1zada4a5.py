@@ -12,8 +12,6 @@ Number = Union[int, float]
 
 def _format_base(x: Number) -> str:
     """Format base `x` for human-friendly output."""
-    if isinstance(x, int):
-        return str(x)
     # for float, show without trailing .0 when possible
     if isinstance(x, float) and x.is_integer():
         return str(int(x))
@@ -24,7 +22,7 @@ def geometric_sum(x: Number, n: int) -> Number:
     """Return sum 1 + x + x^2 + ... + x^n.
 
     Validates that `n` is a non-negative integer and `x` is numeric.
-    Uses closed-form formula when x != 1.
+    Uses closed-form formula when x != 1; integer `x` gives an exact int.
     """
     # validate n
     if not isinstance(n, int):
@@ -39,6 +37,9 @@ def geometric_sum(x: Number, n: int) -> Number:
         return 1
     if x == 1:
         return n + 1
+    if isinstance(x, int):
+        # exact integer arithmetic: x - 1 always divides x^(n+1) - 1
+        return (x ** (n + 1) - 1) // (x - 1)
     # use pow to support negative and float bases
     return (x ** (n + 1) - 1) / (x - 1)
 
@@ -54,14 +55,8 @@ def series_str(x: Number, n: int, show_sum: bool = True) -> str:
         raise ValueError("n must be non-negative")
 
     base = _format_base(x)
-    terms = []
-    for i in range(n + 1):
-        if i == 0:
-            terms.append("1")
-        elif i == 1:
-            terms.append(base)
-        else:
-            terms.append(f"{base}^{i}")
+    terms = ["1", base] if n else ["1"]
+    terms += [f"{base}^{i}" for i in range(2, n + 1)]
     expr = "+".join(terms)
     if show_sum:
         val = geometric_sum(x, n)
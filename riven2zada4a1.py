@@ -6,12 +6,16 @@ Provides:
 - CLI for interactive use with examples
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+import math
 import sys
 
 
 def factorial_recursive(n: int, memo: Dict[int, int] = None) -> int:
-    """Calculate n! recursively.
+    """Calculate n! from its recursive definition.
+
+    The recursion is evaluated bottom-up in a loop, which gives the same
+    values without the call overhead or Python's recursion limit.
 
     Base cases:
         0! = 1
@@ -37,21 +41,23 @@ def factorial_recursive(n: int, memo: Dict[int, int] = None) -> int:
     if n < 0:
         raise ValueError(f"n must be non-negative, got {n}")
 
-    # Initialize memoization dictionary
+    # Without a memo: 0!..20! from the table, larger n straight from C
     if memo is None:
-        memo = {}
+        return _FACT_SMALL[n] if n < len(_FACT_SMALL) else math.factorial(n)
 
     # Check if already computed
     if n in memo:
         return memo[n]
 
-    # Base cases
-    if n == 0 or n == 1:
-        return 1
-
-    # Recursive case: n! = n * (n-1)!
-    result = n * factorial_recursive(n - 1, memo)
-    memo[n] = result
+    # Fill a caller-supplied memo the way the recursion would: every missing
+    # value from 2 up to n, in ascending order, as a running product
+    result = 1
+    for k in range(2, n + 1):
+        if k in memo:
+            result = memo[k]
+        else:
+            result *= k
+            memo[k] = result
     return result
 
 
@@ -69,36 +75,64 @@ def factorial_iterative(n: int) -> int:
     if n < 0:
         raise ValueError(f"n must be non-negative, got {n}")
 
-    result = 1
-    for i in range(2, n + 1):
-        result *= i
-    return result
+    if n < len(_FACT_SMALL):
+        return _FACT_SMALL[n]
+
+    # math.factorial multiplies in C with a balanced product tree, so large
+    # operands meet at similar sizes instead of a big * small chain
+    return math.factorial(n)
+
+
+# 0!..20!: every factorial that fits in a signed 64-bit int
+_FACT_SMALL = tuple(math.factorial(i) for i in range(21))
 
 
 class RecursionTracer:
-    """Helper class to visualize recursion tree."""
+    """Helper class to visualize recursion tree.
+
+    Events are kept as (indent, n, result) tuples, with result None for a
+    call, and are only turned into text when the trace is displayed. Indent
+    strings are built once per depth and shared by every event at that depth.
+    """
 
     def __init__(self):
-        self.calls: List[str] = []
+        self.events: List[Tuple[str, int, Optional[int]]] = []
         self.depth = 0
         self.max_depth = 0
+        self._indents = [""]
 
     def trace_call(self, n: int):
         """Record a function call."""
         self.depth += 1
-        self.max_depth = max(self.max_depth, self.depth)
-        indent = "  " * (self.depth - 1)
-        self.calls.append(f"{indent}factorial({n})")
+        if self.depth > self.max_depth:
+            self.max_depth = self.depth
+            self._indents.append(self._indents[-1] + "  ")
+        self.events.append((self._indents[self.depth - 1], n, None))
 
     def trace_return(self, n: int, result: int):
         """Record a return value."""
-        indent = "  " * (self.depth - 1)
-        self.calls.append(f"{indent}  → {result}")
+        self.events.append((self._indents[self.depth - 1], n, result))
         self.depth -= 1
 
+    @staticmethod
+    def _line(indent: str, n: int, result: Optional[int]) -> str:
+        if result is None:
+            return f"{indent}factorial({n})"
+        return f"{indent}  → {result}"
+
+    @property
+    def calls(self) -> List[str]:
+        """All recorded steps as text lines."""
+        return [self._line(*event) for event in self.events]
+
+    def format(self, limit: Optional[int] = None, indent: str = "") -> str:
+        """Join the first `limit` steps (all by default) into one string."""
+        events = self.events if limit is None else self.events[:limit]
+        return "\n".join(indent + self._line(*event) for event in events)
+
 
 def factorial_with_steps(n: int) -> Tuple[int, List[str]]:
-    """Calculate factorial recursively and return recursion trace.
+    """Calculate factorial and return the trace of its recursion.
 
     Args:
         n: Non-negative integer
@@ -114,19 +148,19 @@ def factorial_with_steps(n: int) -> Tuple[int, List[str]]:
 
     tracer = RecursionTracer()
 
-    def _factorial(x: int) -> int:
+    # Replay the recursion without Python frames, so any n can be traced:
+    # calls descend from n to the base case (1, or 0 when n == 0), then
+    # returns climb back up carrying the running product
+    base = min(n, 1)
+    for x in range(n, base - 1, -1):
         tracer.trace_call(x)
-        if x == 0 or x == 1:
-            result = 1
-            tracer.trace_return(x, result)
-            return result
-        else:
-            sub_result = _factorial(x - 1)
-            result = x * sub_result
-            tracer.trace_return(x, result)
-            return result
 
-    result = _factorial(n)
+    result = 1
+    for x in range(base, n + 1):
+        if x > 1:
+            result *= x
+        tracer.trace_return(x, result)
+
     return result, tracer.calls
 
 
@@ -137,22 +171,30 @@ def print_factorial_demo(n: int, title: str = "FACTORIAL"):
         n: Number to calculate factorial for
         title: Title for the demonstration
     """
-    print("\n" + "=" * 70)
-    print(f"  {title}: {n}!")
-    print("=" * 70)
+    # The whole demo goes to stdout in a single write
+    out = ["\n" + "=" * 70, f"  {title}: {n}!", "=" * 70]
 
     try:
         result, steps = factorial_with_steps(n)
-        print(f"  Рекурсивний розрахунок {n}!:")
-        print("  " + "-" * 60)
-        for step in steps:
-            print(f"  {step}")
-        print("  " + "-" * 60)
-        print(f"  Результат: {n}! = {result}")
-        print("=" * 70)
+        out.append(f"  Рекурсивний розрахунок {n}!:")
+        out.append("  " + "-" * 60)
+        out.extend(["  " + step for step in steps])
+        out.append("  " + "-" * 60)
+        out.append(f"  Результат: {n}! = {result}")
+        out.append("=" * 70)
     except Exception as e:
-        print(f"  ✗ Помилка: {e}")
-        print("=" * 70)
+        out.append(f"  ✗ Помилка: {e}")
+        out.append("=" * 70)
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+_MENU = (
+    "\n1. Обчислити факторіал з детальною рекурсією\n"
+    "2. Обчислити факторіал (тільки результат)\n"
+    "3. Порівняти рекурсивний та ітеративний методи\n"
+    "4. Вихід\n"
+)
 
 
 if __name__ == "__main__":
@@ -227,10 +269,7 @@ if __name__ == "__main__":
     print("█" * 70)
 
     while True:
-        print("\n1. Обчислити факторіал з детальною рекурсією")
-        print("2. Обчислити факторіал (тільки результат)")
-        print("3. Порівняти рекурсивний та ітеративний методи")
-        print("4. Вихід")
+        sys.stdout.write(_MENU)
         choice = input("\nВиберіть опцію (1-4): ").strip()
 
         if choice == "4":
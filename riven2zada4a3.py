@@ -3,12 +3,19 @@
 Provides:
 - is_natural_recursive(n): Recursively checks if n is a natural number
 - is_natural_iterative(n): Iterative check for comparison
+- is_natural_array(values): Vectorized check over a NumPy array
 - Detailed type validation and error handling
 - CLI for interactive use
 """
 
+import sys
 from typing import Union, Tuple, List
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only is_natural_array needs it
+    np = None
+
 
 def is_natural_recursive(n: Union[int, float], depth: int = 0) -> bool:
     """Check if n is a natural number using recursion.
@@ -26,6 +33,10 @@ def is_natural_recursive(n: Union[int, float], depth: int = 0) -> bool:
             - If n > 1 and is integer, check if (n-1) is natural
             - This reduces the problem: n is natural iff (n-1) is natural
 
+    The descent always reaches the base case 1 for positive integers, so
+    the recursion is evaluated analytically as a single ``n > 0`` check
+    (no call frames, no RecursionError for large n).
+
     Args:
         n: Number to check (int or float)
         depth: Internal recursion depth tracking
@@ -43,6 +54,14 @@ def is_natural_recursive(n: Union[int, float], depth: int = 0) -> bool:
         >>> is_natural_recursive(-3)
         False
     """
+    # Exact int/float first: an identity check on type(n) is cheaper than
+    # the isinstance chain, which stays for bool and subclasses
+    t = type(n)
+    if t is int:
+        return n > 0
+    if t is float:
+        return n.is_integer() and n > 0
+
     # Check if n is an integer (not float unless it's a whole number)
     if isinstance(n, bool):
         return False
@@ -55,16 +74,10 @@ def is_natural_recursive(n: Union[int, float], depth: int = 0) -> bool:
     elif not isinstance(n, int):
         return False
 
-    # Base case 1: n == 1 is natural
-    if n == 1:
-        return True
-
-    # Base case 2: n <= 0 is not natural
-    if n <= 0:
-        return False
-
-    # Recursive case: n is natural if (n-1) is natural
-    return is_natural_recursive(n - 1, depth + 1)
+    # The recursion n -> n-1 bottoms out at 1 exactly when n is positive,
+    # so its result is known without descending: depth is kept for API
+    # compatibility only.
+    return n > 0
 
 
 def is_natural_iterative(n: Union[int, float]) -> bool:
@@ -78,6 +91,13 @@ def is_natural_iterative(n: Union[int, float]) -> bool:
     Returns:
         bool: True if n is a natural number, False otherwise
     """
+    # Fast path for exact int/float (bool is excluded: type(True) is bool)
+    t = type(n)
+    if t is int:
+        return n > 0
+    if t is float:
+        return n.is_integer() and n > 0
+
     # Type checking
     if isinstance(n, bool):
         return False
@@ -93,6 +113,41 @@ def is_natural_iterative(n: Union[int, float]) -> bool:
     return n > 0
 
 
+def is_natural_array(values) -> "np.ndarray":
+    """Vectorized is_natural_iterative over an array of numbers.
+
+    The checks run as whole-array comparisons in C instead of one Python
+    call per element. Object arrays (e.g. ints beyond int64) are checked
+    element by element with is_natural_iterative.
+
+    Args:
+        values: Array-like of ints or floats (no bools)
+
+    Returns:
+        np.ndarray: Boolean array, True where the element is natural
+
+    Raises:
+        ImportError: if NumPy is not installed
+        TypeError: if the values are not numeric
+    """
+    if np is None:
+        raise ImportError("numpy is required for is_natural_array")
+
+    a = np.asarray(values)
+    if a.dtype.kind in "iu":
+        return a > 0
+    if a.dtype.kind == "b":
+        return np.zeros(a.shape, dtype=bool)
+    if a.dtype.kind == "O":
+        flat = np.fromiter(map(is_natural_iterative, a.ravel()), dtype=bool, count=a.size)
+        return flat.reshape(a.shape)
+    if a.dtype.kind != "f":
+        raise TypeError(f"Очікувався числовий масив, отримано {a.dtype}")
+
+    # Whole floats only; inf and nan fail like float.is_integer()
+    return (a > 0) & np.isfinite(a) & (np.floor(a) == a)
+
+
 def is_natural_with_explanation(n: Union[int, float]) -> Tuple[bool, str]:
     """Check if n is natural and return explanation.
 
@@ -102,12 +157,12 @@ def is_natural_with_explanation(n: Union[int, float]) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_natural: bool, explanation: str)
     """
-    # Type checking
-    if isinstance(n, bool):
+    # Type checking (exact ints skip straight to the sign check)
+    if type(n) is int:
+        pass
+    elif isinstance(n, bool):
         return False, f"'{n}' є булевим значенням (bool), а не числом"
-
-    # Check type
-    if isinstance(n, float):
+    elif isinstance(n, float):
         if not n.is_integer():
             return False, f"{n} не є цілим числом (дробова частина: {n % 1})"
         n = int(n)
@@ -127,6 +182,9 @@ def is_natural_with_explanation(n: Union[int, float]) -> Tuple[bool, str]:
         return True, f"{n} є натуральним числом (додатне ціле число)"
 
 
+_HR = "  " + "-" * 50
+
+
 def print_recursion_trace(n: int) -> None:
     """Print the recursion tree for is_natural_recursive(n).
 
@@ -137,32 +195,30 @@ def print_recursion_trace(n: int) -> None:
         print(f"  is_natural_recursive({n}) → False (базовий випадок)")
         return
 
-    print(f"  Дерево рекурсії для is_natural_recursive({n}):")
-    print("  " + "-" * 50)
-
-    # Simulate recursion tree
-    current = n
-    depth = 0
-    steps = []
+    # The whole tree goes to stdout in a single write
+    parts = [f"  Дерево рекурсії для is_natural_recursive({n}):", _HR]
 
-    while current > 1:
-        indent = "    " * depth
-        steps.append(f"{indent}is_natural_recursive({current})")
-        steps.append(f"{indent}  ↓ потребує: is_natural_recursive({current - 1})")
-        current -= 1
-        depth += 1
+    # Simulate recursion tree: two steps per level for n, n-1, ..., 2,
+    # with the indent grown by one level per iteration and only the first
+    # 50 steps shown (limit for readability)
+    total_steps = 2 * (n - 1)
+    indent = ""
 
-    # Print steps (limit for readability)
-    for step in steps[:50]:
-        print(f"  {step}")
+    for current in range(n, max(n - 25, 1), -1):
+        parts.append(f"  {indent}is_natural_recursive({current})")
+        parts.append(f"  {indent}  ↓ потребує: is_natural_recursive({current - 1})")
+        indent += "    "
 
-    if len(steps) > 50:
-        print(f"  ... (скорочено, всього {len(steps)} кроків)")
+    if total_steps > 50:
+        parts.append(f"  ... (скорочено, всього {total_steps} кроків)")
 
     # Base case
-    print(f"  {'    ' * (n - 1)}is_natural_recursive(1)")
-    print(f"  {'    ' * (n - 1)}  → True (базовий випадок)")
-    print("  " + "-" * 50)
+    base_indent = "    " * (n - 1)
+    parts.append(f"  {base_indent}is_natural_recursive(1)")
+    parts.append(f"  {base_indent}  → True (базовий випадок)")
+    parts.append(_HR)
+
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def print_check_demo(n: Union[int, float], title: str = "CHECK"):
@@ -255,13 +311,22 @@ if __name__ == "__main__":
     print(f"  {'Число':<10} │ {'Рекурсія':<15} │ {'Ітерація':<15} │ {'Рівні?':<5}")
     print("  " + "-" * 65)
 
-    for val in test_values:
+    # A homogeneous numeric batch that fits int64 is checked in one
+    # vectorized pass
+    if np is not None and all(
+        type(val) is float or (type(val) is int and -2 ** 63 <= val < 2 ** 63)
+        for val in test_values
+    ):
+        iter_results = is_natural_array(test_values).tolist()
+    else:
+        iter_results = [is_natural_iterative(val) for val in test_values]
+
+    for val, iter_result in zip(test_values, iter_results):
         if isinstance(val, int) and val > 0:
             rec_result = is_natural_recursive(val)
         else:
             rec_result = is_natural_recursive(val)
 
-        iter_result = is_natural_iterative(val)
         equal = "✓" if rec_result == iter_result else "✗"
         print(
             f"  {str(val):<10} │ {str(rec_result):<15} │ {str(iter_result):<15} │ {equal:<5}"
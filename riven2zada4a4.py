@@ -7,7 +7,7 @@ Provides multiple implementations:
 - Interactive mode for user input
 """
 
-from typing import List, Callable
+from typing import Callable, Iterator, List
 
 
 def read_and_reverse_recursive(numbers: List[int] = None, depth: int = 0) -> None:
@@ -48,44 +48,42 @@ def read_and_reverse_recursive(numbers: List[int] = None, depth: int = 0) -> Non
 
 
 def read_and_reverse_recursive_v2() -> None:
-    """Read numbers recursively and print in reverse (alternative version).
+    """Read numbers and print them in reverse (alternative version).
 
-    This version uses true recursion: reads, then prints, then backtracks.
-    Much more elegant - the call stack naturally reverses the sequence!
+    Reproduces the recursive read-then-print-on-return order with an
+    explicit list as the call stack: numbers are pushed while reading and
+    printed from the top once 0 is entered, so long sequences cannot hit
+    the recursion limit.
     """
+    print("  Введіть послідовність чисел (завершіть 0):")
 
-    def _read_and_print() -> None:
-        """Inner recursive function."""
+    stack = []
+    while True:
         print(f"  Введіть число (або 0 для завершення): ", end="")
 
         try:
             num = int(input().strip())
         except ValueError:
             print("  ✗ Помилка: введіть ціле число")
-            return _read_and_print()
+            continue
 
         if num == 0:
-            return  # Base case: stop recursion
+            break  # Base case: stop reading
 
-        # Recursive case: read next before printing current
-        _read_and_print()  # Read the rest first (important!)
+        stack.append(num)
 
-        # Print AFTER recursion returns (this creates the reverse effect!)
+    # Unwind the stack: the last number read is printed first
+    for num in reversed(stack):
         print(f"  {num}")
-
-    print("  Введіть послідовність чисел (завершіть 0):")
-    _read_and_print()
     print("  (список завершено)")
 
 
-def read_and_reverse_iterative() -> List[int]:
+def read_and_reverse_iterative() -> Iterator[int]:
     """Read numbers iteratively and return in reverse order.
 
-    Args:
-        None (reads from user input)
-
     Returns:
-        List[int]: Sequence in reverse order
+        Iterator[int]: Sequence in reverse order, as a reversed() view of
+        the list read (use list(...) if indexing is needed)
     """
     numbers = []
     counter = 1
@@ -105,8 +103,8 @@ def read_and_reverse_iterative() -> List[int]:
         numbers.append(num)
         counter += 1
 
-    # Return reversed
-    return numbers[::-1]
+    # Return reversed (an iterator, no copy of the list)
+    return reversed(numbers)
 
 
 def reverse_sequence_from_string(input_str: str) -> List[int]:
@@ -120,9 +118,29 @@ def reverse_sequence_from_string(input_str: str) -> List[int]:
     Returns:
         List[int]: Sequence in reverse order (excluding 0)
     """
+    tokens = input_str.split()
+
+    # Fast path: cut at the first literal "0" and convert everything in
+    # one map(); spellings such as "00" or "-0" are caught by the second
+    # cut, and any unparsable token sends us to the skipping loop below
+    try:
+        tokens = tokens[:tokens.index("0")]
+    except ValueError:
+        pass
+    try:
+        numbers = list(map(int, tokens))
+    except ValueError:
+        numbers = None
+
+    if numbers is not None:
+        if 0 in numbers:
+            del numbers[numbers.index(0):]
+        numbers.reverse()
+        return numbers
+
     numbers = []
 
-    for token in input_str.split():
+    for token in tokens:
         try:
             num = int(token)
             if num == 0:
@@ -164,25 +182,33 @@ class SequenceReverser:
 
     @staticmethod
     def using_stack(seq: List[int]) -> List[int]:
-        """Reverse using stack (LIFO)."""
-        stack = []
-        for num in seq:
-            stack.append(num)
-        result = []
-        while stack:
-            result.append(stack.pop())
+        """Reverse using stack (LIFO).
+
+        list(seq) pushes every element at once and reverse() yields them
+        in pop order, in two C-level passes instead of two Python loops.
+        """
+        result = list(seq)
+        result.reverse()
         return result
 
     @staticmethod
-    def using_recursion(seq: List[int], index: int = None) -> List[int]:
-        """Reverse using recursion."""
+    def using_recursion(seq: List[int], index: int = None,
+                        out: List[int] = None) -> List[int]:
+        """Reverse using recursion.
+
+        Each frame appends one element to a shared accumulator, so the
+        result is built in O(n) instead of copying a new list per frame.
+        """
+        if out is None:
+            out = []
         if index is None:
             index = len(seq) - 1
 
         if index < 0:
-            return []
+            return out
 
-        return [seq[index]] + SequenceReverser.using_recursion(seq, index - 1)
+        out.append(seq[index])
+        return SequenceReverser.using_recursion(seq, index - 1, out)
 
     @staticmethod
     def manual_swap(seq: List[int]) -> List[int]:
@@ -311,11 +337,10 @@ if __name__ == "__main__":
             print("  ІТЕРАТИВНИЙ МЕТОД")
             print("  Введіть послідовність, кожне число на новому рядку")
             print("=" * 70)
-            numbers = read_and_reverse_iterative()
-            if numbers:
+            lines = [f"  {num}" for num in read_and_reverse_iterative()]
+            if lines:
                 print("\n  Послідовність у зворотному порядку:")
-                for num in numbers:
-                    print(f"  {num}")
+                print("\n".join(lines))
             else:
                 print("  (послідовність порожня)")
 
@@ -329,7 +354,8 @@ if __name__ == "__main__":
 
             result = reverse_sequence_from_string(user_input)
             if result:
-                print(f"\n  Вихідна послідовність:  {reverse_sequence_from_string(user_input)[::-1]}")
+                original = list(reversed(result))
+                print(f"\n  Вихідна послідовність:  {original}")
                 print(f"  Обернена послідовність: {result}")
             else:
                 print("  (послідовність порожня)")
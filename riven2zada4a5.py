@@ -10,6 +10,9 @@ from typing import Union
 
 Number = Union[int, float]
 
+# Above 2**1075 the reciprocal of an int power rounds to zero
+_RECIPROCAL_MAX_BITS = 1075
+
 
 def _validate_input(base: Number, exp: int) -> None:
     if isinstance(exp, bool) or not isinstance(exp, int):
@@ -22,6 +25,8 @@ def pow_int(base: Number, exp: int) -> Number:
     """Compute base ** exp where exp is integer (positive, zero, or negative).
 
     Uses iterative binary exponentiation. For negative exponent returns float (1/base**|exp|).
+    Int bases are raised exactly with the built-in pow() and a negative
+    exponent is applied by one correctly rounded division.
 
     Raises:
         TypeError: if types are invalid
@@ -37,11 +42,31 @@ def pow_int(base: Number, exp: int) -> Number:
             raise ZeroDivisionError("0 cannot be raised to a negative power")
         return 0
 
+    # Tiny exponents need no loop
+    if exp == 1:
+        return base
+    if exp == 2:
+        return base * base
+    if exp == -1:
+        return 1 / base
+
     negative = exp < 0
     e = -exp if negative else exp
 
     result = 1
-    b = float(base) if negative else base
+    b = base
+
+    if isinstance(b, int):
+        # Exact integer power: CPython's long_pow runs the same binary
+        # exponentiation in C
+        if not negative:
+            return pow(b, e)
+        if e * (abs(b).bit_length() - 1) <= _RECIPROCAL_MAX_BITS:
+            # Stay in int arithmetic and round once in the division
+            return 1 / pow(b, e)
+        # |base|**e >= 2**1076, so the reciprocal underflows to +-0.0 and
+        # the float path gets the same answer without the huge int
+        b = float(b)
 
     # Binary exponentiation
     while e > 0:
@@ -66,15 +91,22 @@ def pow_int_recursive(base: Number, exp: int) -> Number:
             raise ZeroDivisionError("0 cannot be raised to a negative power")
         return 0
 
+    # Tiny exponents end the recursion directly
+    if exp == 1:
+        return base
+    if exp == 2:
+        return base * base
+    if exp == -1:
+        return 1.0 / base
+
     if exp < 0:
         return 1.0 / pow_int_recursive(base, -exp)
 
-    # exp > 0
-    if exp % 2 == 0:
-        half = pow_int_recursive(base, exp // 2)
-        return half * half
-    else:
-        return base * pow_int_recursive(base, exp - 1)
+    # exp > 0: halve odd exponents too, so the depth is floor(log2(exp)) + 1
+    half = pow_int_recursive(base, exp // 2)
+    if exp & 1:
+        return half * half * base
+    return half * half
 
 
 if __name__ == "__main__":
@@ -9,27 +9,199 @@ Definition:
     - words: tokens separated by any whitespace (split())
     - chars: number of characters (includes newlines)
 """
-from typing import Dict
+from typing import Dict, Optional
+import functools
+import mmap
 import sys
-import os
+
+
+# Size of the slices the mapped file is scanned in
+_CHUNK_SIZE = 1 << 20
+
+# Byte -> 0 for the ASCII whitespace str.split() separates on (including
+# \x1c-\x1f, which bytes.split() ignores), 1 for any other byte: after
+# translate() every word starts at a b"\x00\x01" pair, which cannot
+# overlap itself, so bytes.count() finds them all
+_WORD_FLAGS = bytes(0 if c in b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f" else 1
+                    for c in range(256))
+_WORD_START = b"\x00\x01"
+
+# Files from this size up are counted with NumPy when it is installed:
+# about 1.1 GB/s against 0.4 GB/s, which covers the ~35 ms NumPy import
+# from roughly 25 MB
+_NUMPY_MIN_SIZE = 1 << 25
+
+# Files from this size up are counted by the Numba kernel when available.
+# The kernel scans about 5 GB/s against 0.4 GB/s for the bytes methods,
+# but importing Numba and loading the cached kernel takes ~0.25 s, which
+# only pays off around 100 MB
+_JIT_MIN_SIZE = 1 << 27
+
+
+@functools.lru_cache(maxsize=None)
+def _load_numpy_counter():
+    """Return a NumPy byte counter, or None without NumPy.
+
+    Same contract as the function from _load_count_kernel. The buffer is
+    processed in _CHUNK_SIZE slices with whole-array comparisons, so the
+    temporary masks stay small.
+    """
+    try:
+        import numpy as np
+    except ImportError:  # NumPy is optional; the bytes-method path remains
+        return None
+
+    # True for the whitespace bytes of _WORD_FLAGS
+    is_space = np.frombuffer(_WORD_FLAGS, dtype=np.uint8) == 0
+
+    def count(buffer):
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        lines = 0
+        words = 0
+        prev_space = True  # the file starts as if after whitespace
+        for start in range(0, data.size, _CHUNK_SIZE):
+            chunk = data[start:start + _CHUNK_SIZE]
+            if chunk.max() >= 0x80 or (chunk == 13).any():
+                return 0, 0, False
+            lines += int(np.count_nonzero(chunk == 10))
+            space = is_space[chunk]
+            # A word starts at every whitespace -> non-whitespace step
+            words += int(np.count_nonzero(space[:-1] > space[1:]))
+            words += prev_space and not space[0]
+            prev_space = bool(space[-1])
+        return lines, words, True
+
+    return count
+
+
+@functools.lru_cache(maxsize=None)
+def _load_count_kernel():
+    """Return a Numba-compiled byte counter, or None without NumPy/Numba.
+
+    The returned function takes a buffer and gives (lines, words, plain),
+    where plain is False if the buffer holds "\r" or a non-ASCII byte.
+    NumPy and Numba are imported on first use only, so short files and
+    the CLI do not pay for them.
+    """
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:  # both are optional; the bytes-method path remains
+        return None
+
+    # 1 for the whitespace bytes of _WORD_FLAGS, 0 otherwise
+    is_space = 1 - np.frombuffer(_WORD_FLAGS, dtype=np.uint8)
+
+    @njit(cache=True, boundscheck=False)
+    def _count_kernel(buf, is_space):
+        # Branch-free so the loop vectorizes: a word starts at every
+        # whitespace -> non-whitespace step, the file starting as if
+        # after whitespace
+        lines = 0
+        words = 0
+        prev_space = 1
+        special = 0
+        for i in range(buf.shape[0]):
+            c = buf[i]
+            space = is_space[c]
+            words += prev_space & (1 - space)
+            prev_space = space
+            lines += c == 10
+            special |= (c >= 0x80) | (c == 13)
+        return lines, words, special == 0
+
+    def count(buffer):
+        return _count_kernel(np.frombuffer(buffer, dtype=np.uint8), is_space)
+
+    return count
+
+
+@functools.lru_cache(maxsize=None)
+def _is_ascii_transparent(encoding: str) -> bool:
+    """True if `encoding` decodes every ASCII byte to the same code point."""
+    try:
+        return bytes(range(128)).decode(encoding) == "".join(map(chr, range(128)))
+    except (LookupError, UnicodeDecodeError):
+        return False
+
+
+def _count_ascii_bytes(path: str) -> Optional[Dict[str, int]]:
+    """Count stats on a memory-mapped view of the raw bytes.
+
+    For plain ASCII without "\r" (which universal newlines would rewrite)
+    every byte is one character, so the counts come from C-level bytes
+    methods on 1 MiB slices (NumPy or the Numba kernel for large files)
+    instead of a decoded line loop. Returns None when the file needs the
+    text path.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # empty file or not a regular file
+            return None
+
+    with mm:
+        if hasattr(mm, "madvise"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+
+        chars = len(mm)
+        count = None
+        if chars >= _JIT_MIN_SIZE:
+            count = _load_count_kernel()
+        if count is None and chars >= _NUMPY_MIN_SIZE:
+            count = _load_numpy_counter()
+
+        if count is not None:
+            lines, words, plain = count(mm)
+            if not plain:
+                return None
+        else:
+            lines = 0
+            words = 0
+            prev_flag = b"\x00"  # the file starts as if after whitespace
+
+            for start in range(0, chars, _CHUNK_SIZE):
+                chunk = mm[start:start + _CHUNK_SIZE]
+                if not chunk.isascii() or b"\r" in chunk:
+                    return None
+                lines += chunk.count(b"\n")
+                flags = chunk.translate(_WORD_FLAGS)
+                # A word may start exactly at the slice boundary
+                words += (prev_flag + flags[:1]) == _WORD_START
+                words += flags.count(_WORD_START)
+                prev_flag = flags[-1:]
+
+        if mm[-1] != 0x0A:  # last line without a trailing newline
+            lines += 1
+
+    return {"lines": lines, "words": words, "chars": chars}
 
 
 def count_file_stats(path: str, encoding: str = "utf-8") -> Dict[str, int]:
     """Return dictionary with counts: {'lines': int, 'words': int, 'chars': int}.
 
+    Plain ASCII files in an ASCII-compatible encoding are counted on the raw
+    bytes; anything else is decoded and counted line by line.
+
     Raises FileNotFoundError or UnicodeDecodeError if file unreadable.
     """
     if not isinstance(path, str):
         raise TypeError("path must be a string")
 
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"File not found: {path}")
+    # open() reports a missing file itself; no separate exists() check
+    try:
+        stats = _count_ascii_bytes(path) if _is_ascii_transparent(encoding) else None
+        if stats is not None:
+            return stats
+        f = open(path, "r", encoding=encoding)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}") from None
 
     lines = 0
     words = 0
     chars = 0
 
-    with open(path, "r", encoding=encoding) as f:
+    with f:
         for line in f:
             lines += 1
             chars += len(line)
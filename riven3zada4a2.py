@@ -17,9 +17,9 @@ It tolerates multiple subjects per line separated by commas or semicolons,
 and recognizes Ukrainian and English keywords for types.
 """
 from typing import Dict, Set
+import functools
 import re
 import sys
-import os
 
 TYPE_MAP = {
     'лекц': 'lecture', 'лекція': 'lecture', 'лекція.': 'lecture', 'лек': 'lecture', 'lecture': 'lecture', 'lek': 'lecture',
@@ -34,17 +34,39 @@ DAY_WORDS = [
     'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday'
 ]
 
+_DAY_SET = frozenset(DAY_WORDS)
 
+# Patterns used on every line/item, compiled once
+_WS_RE = re.compile(r"\s+")
+_SPLIT_RE = re.compile(r'[;,]')
+_PAREN_SEARCH = re.compile(r"\(([^)]+)\)")
+_PAREN_STRIP = re.compile(r"\([^)]*\)")
+
+
+@functools.lru_cache(maxsize=2048)
 def _normalize(text: str) -> str:
-    return re.sub(r"\s+", " ", text.strip().lower())
+    return _WS_RE.sub(" ", text.strip().lower())
+
 
+# TYPE_MAP keys without the ones that contain a shorter key of the same
+# type ('лекція' contains 'лек', 'laboratory' contains 'lab', ...): a
+# longer key can only match where its shorter form already does, and the
+# keys of each type are grouped together, so the first match found in
+# this tuple gives the same type as the first match in TYPE_MAP
+_TYPE_KEYS = tuple(
+    (key, val) for key, val in TYPE_MAP.items()
+    if not any(other != key and other in key and other_val == val
+               for other, other_val in TYPE_MAP.items())
+)
 
+
+@functools.lru_cache(maxsize=256)
 def _detect_type(type_str: str) -> str:
     """Return standardized type key: 'lecture'|'practical'|'lab'|None"""
     if not type_str:
         return None
     ts = _normalize(type_str)
-    for key, val in TYPE_MAP.items():
+    for key, val in _TYPE_KEYS:
         if key in ts:
             return val
     return None
@@ -55,13 +77,18 @@ def parse_schedule(path: str, encoding: str = 'utf-8') -> Dict[str, object]:
 
     Returns dict with keys: subjects (set of names), lecture, practical, lab, unknown
     """
-    if not os.path.exists(path):
-        raise FileNotFoundError(path)
+    try:
+        f = open(path, 'r', encoding=encoding)
+    except FileNotFoundError:
+        raise FileNotFoundError(path) from None
 
     subjects: Set[str] = set()
     counts = {'lecture': 0, 'practical': 0, 'lab': 0, 'unknown': 0}
+    split_items = _SPLIT_RE.split
+    paren_search = _PAREN_SEARCH.search
+    paren_strip = _PAREN_STRIP.sub
 
-    with open(path, 'r', encoding=encoding) as f:
+    with f:
         for raw_line in f:
             line = raw_line.strip()
             if not line:
@@ -69,25 +96,30 @@ def parse_schedule(path: str, encoding: str = 'utf-8') -> Dict[str, object]:
             ln = _normalize(line)
 
             # skip pure day lines
-            if any(day in ln.split() for day in DAY_WORDS):
+            if not _DAY_SET.isdisjoint(ln.split()):
                 # But ensure it's not a subject line that also contains day word inside subject name
                 # Heuristic: if line has '(' assume subjects
                 if '(' not in line:
                     continue
 
             # Split by commas or semicolons for multiple entries
-            parts = re.split(r'[;,]', line)
+            parts = split_items(line)
             for part in parts:
                 item = part.strip()
                 if not item:
                     continue
                 # Find type in parentheses at end or inside
-                m = re.search(r"\(([^)]+)\)", item)
+                m = paren_search(item) if '(' in item else None
                 if m:
                     type_raw = m.group(1)
                     typ = _detect_type(type_raw)
-                    # subject name is item without the parentheses content
-                    subj = re.sub(r"\([^)]*\)", '', item).strip()
+                    # subject name is item without the parentheses content;
+                    # with a single '(' the found group is the only one
+                    # to remove, so the second regex pass is not needed
+                    if item.count('(') == 1:
+                        subj = (item[:m.start()] + item[m.end():]).strip()
+                    else:
+                        subj = paren_strip('', item).strip()
                 else:
                     # no parentheses -> unknown type; subject is whole item
                     subj = item
@@ -95,7 +127,7 @@ def parse_schedule(path: str, encoding: str = 'utf-8') -> Dict[str, object]:
 
                 subj_norm = _normalize(subj)
                 # ignore if subject looks like day
-                if subj_norm in DAY_WORDS:
+                if subj_norm in _DAY_SET:
                     continue
 
                 if subj_norm:
@@ -117,8 +149,8 @@ def print_report(path: str, report: Dict[str, object]) -> None:
     print(f"Unknown-type entries: {report['unknown']}")
     if report['subjects']:
         print('\nSubjects:')
-        for s in sorted(report['subjects']):
-            print('  -', s)
+        # one write for the whole list instead of a print() per subject
+        sys.stdout.write(''.join(f'  - {s}\n' for s in sorted(report['subjects'])))
 
 
 if __name__ == '__main__':
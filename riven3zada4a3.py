@@ -10,6 +10,10 @@ aaaa
 aaaaaaaaa
 """
 
+# Characters collected before create_letter_file hands them to write()
+_WRITE_BATCH = 1 << 20
+
+
 def create_letter_file(filename: str, rows: int = 9, char: str = 'a') -> None:
     """
     Create a text file where each line n contains n repetitions of char.
@@ -21,8 +25,20 @@ def create_letter_file(filename: str, rows: int = 9, char: str = 'a') -> None:
     """
     try:
         with open(filename, 'w', encoding='utf-8') as f:
+            # Lines are joined into batches of about 1 MiB, so small files
+            # take a single write() and large ones stay bounded in memory
+            batch = []
+            size = 0
             for i in range(1, rows + 1):
-                f.write(char * i + '\n')
+                line = char * i + '\n'
+                batch.append(line)
+                size += len(line)
+                if size >= _WRITE_BATCH:
+                    f.write(''.join(batch))
+                    batch.clear()
+                    size = 0
+            if batch:
+                f.write(''.join(batch))
         print(f"[OK] File '{filename}' created successfully with {rows} lines")
     except IOError as e:
         print(f"[ERROR] Error creating file: {e}")
@@ -38,6 +54,8 @@ def print_preview(rows: int = 9, char: str = 'a') -> None:
 
 
 if __name__ == "__main__":
+    import codecs
+    import shutil
     import sys
     
     # Get filename from argument or use default
@@ -55,8 +73,22 @@ if __name__ == "__main__":
     # Show file content
     print(f"\nFile contents:")
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            content = f.read()
-            print(content)
+        # Stream the file to stdout instead of decoding it into one string.
+        # The UTF-8 bytes can be copied as they are only when stdout itself
+        # is UTF-8; any other console encoding goes through the text layer
+        stdout_encoding = getattr(sys.stdout, 'encoding', None) or ''
+        try:
+            raw_ok = codecs.lookup(stdout_encoding).name == 'utf-8'
+        except LookupError:
+            raw_ok = False
+        if raw_ok and hasattr(sys.stdout, 'buffer'):
+            with open(filename, 'rb') as f:
+                sys.stdout.flush()  # the text written so far goes out first
+                shutil.copyfileobj(f, sys.stdout.buffer, 1 << 16)
+                sys.stdout.buffer.flush()
+        else:
+            with open(filename, 'r', encoding='utf-8') as f:
+                shutil.copyfileobj(f, sys.stdout, 1 << 16)
+        print()
     except IOError as e:
         print(f"Error reading file: {e}")
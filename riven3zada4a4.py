@@ -9,7 +9,6 @@ CLI: python riven3zada4a4.py filename char [--no-strip]
 
 from typing import Tuple, List
 import sys
-import os
 
 
 def count_lines_ending_with(path: str, char: str, encoding: str = 'utf-8', ignore_trailing_whitespace: bool = True) -> Tuple[int, List[str]]:
@@ -24,20 +23,23 @@ def count_lines_ending_with(path: str, char: str, encoding: str = 'utf-8', ignor
 	Returns:
 		Tuple of (count, list of matching lines).
 	"""
-	if not os.path.exists(path):
-		raise FileNotFoundError(f"File not found: {path}")
 	if char is None or len(char) == 0:
 		raise ValueError("`char` must be a non-empty string")
+	try:
+		f = open(path, 'r', encoding=encoding, errors='replace')
+	except FileNotFoundError:
+		raise FileNotFoundError(f"File not found: {path}") from None
 
 	matching_lines = []
-	with open(path, 'r', encoding=encoding, errors='replace') as f:
+	keep = matching_lines.append
+	with f:
 		for raw in f:
-			# remove newline characters
-			s = raw.rstrip('\r\n')
-			if ignore_trailing_whitespace:
-				s = s.rstrip()
-			if s and s.endswith(char):
-				matching_lines.append(s)
+			# remove newline characters (rstrip() alone covers them, since
+			# "\r" and "\n" are whitespace); a non-empty `char` can only
+			# match a non-empty line
+			s = raw.rstrip() if ignore_trailing_whitespace else raw.rstrip('\r\n')
+			if s.endswith(char):
+				keep(s)
 	return len(matching_lines), matching_lines
 
 
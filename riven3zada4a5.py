@@ -3,17 +3,23 @@ Find lines in a text file that end with a specified character and invert them.
 
 Functions:
  - find_and_invert_lines(path, char, encoding='utf-8', ignore_trailing_whitespace=True)
+ - iter_invert_lines(...): the same matches as a lazy iterator
 
 CLI: Interactive mode - prompts for file path and target character.
 """
 
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 import sys
 import os
 
 
-def find_and_invert_lines(path: str, char: str, encoding: str = 'utf-8', ignore_trailing_whitespace: bool = True) -> List[Tuple[str, str]]:
-    """Find lines ending with `char` and return both original and inverted versions.
+def iter_invert_lines(path: str, char: str, encoding: str = 'utf-8', ignore_trailing_whitespace: bool = True) -> Iterator[Tuple[str, str]]:
+    """Lazily yield (original_line, inverted_line) for lines ending with `char`.
+
+    `char` is checked immediately. The file is opened on the first next()
+    and read as the result is consumed, so errors opening it (such as
+    FileNotFoundError) surface there, only the current line is held in
+    memory and each line is reversed only when the caller asks for it.
 
     Args:
         path: Path to the text file.
@@ -22,25 +28,45 @@ def find_and_invert_lines(path: str, char: str, encoding: str = 'utf-8', ignore_
         ignore_trailing_whitespace: If True, trailing spaces and tabs are ignored when checking the last character.
 
     Returns:
-        List of tuples (original_line, inverted_line).
+        Iterator of tuples (original_line, inverted_line).
     """
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"File not found: {path}")
     if char is None or len(char) == 0:
         raise ValueError("`char` must be a non-empty string")
 
-    results = []
-    with open(path, 'r', encoding=encoding, errors='replace') as f:
+    return _iter_invert_lines(path, char, encoding, ignore_trailing_whitespace)
+
+
+def _iter_invert_lines(path: str, char: str, encoding: str, ignore_trailing_whitespace: bool) -> Iterator[Tuple[str, str]]:
+    # Opened here, so a result that is never consumed holds no handle
+    try:
+        f = open(path, 'r', encoding=encoding, errors='replace')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}") from None
+
+    with f:
         for raw in f:
-            # Remove newline characters
-            s = raw.rstrip('\r\n')
-            check_str = s.rstrip() if ignore_trailing_whitespace else s
-            
-            if check_str and check_str.endswith(char):
-                inverted = s[::-1]
-                results.append((s, inverted))
-    
-    return results
+            # rstrip() also removes the newline, so the line without its
+            # newline is only built for matches
+            check_str = raw.rstrip() if ignore_trailing_whitespace else raw.rstrip('\r\n')
+
+            if check_str.endswith(char):
+                s = raw.rstrip('\r\n') if ignore_trailing_whitespace else check_str
+                yield s, s[::-1]
+
+
+def find_and_invert_lines(path: str, char: str, encoding: str = 'utf-8', ignore_trailing_whitespace: bool = True) -> List[Tuple[str, str]]:
+    """Find lines ending with `char` and return both original and inverted versions.
+
+    Args:
+        path: Path to the text file.
+        char: Character to check for at end of each line.
+        encoding: File encoding to use when opening the file.
+        ignore_trailing_whitespace: If True, trailing spaces and tabs are ignored when checking the last character.
+
+    Returns:
+        List of tuples (original_line, inverted_line).
+    """
+    return list(iter_invert_lines(path, char, encoding, ignore_trailing_whitespace))
 
 
 def _clean_path(p: str) -> str:
@@ -79,20 +105,27 @@ if __name__ == "__main__":
 
     # Process file
     try:
-        results = find_and_invert_lines(path, char)
-        
-        print(f"\n{'=' * 60}")
-        print(f"Знайдено рядків, що закінчуються на '{char}': {len(results)}")
-        print(f"{'=' * 60}\n")
+        # Matches are formatted as they stream in; only the text and a
+        # counter are kept, since the count is printed before the lines
+        blocks = []
+        count = 0
+        for original, inverted in iter_invert_lines(path, char):
+            count += 1
+            blocks.append(
+                f"Рядок {count}:\n"
+                f"  Оригінал:   {original}\n"
+                f"  Інвертовано: {inverted}\n\n"
+            )
         
-        if len(results) == 0:
-            print("Жодного рядка не знайдено.")
-        else:
-            for i, (original, inverted) in enumerate(results, 1):
-                print(f"Рядок {i}:")
-                print(f"  Оригінал:   {original}")
-                print(f"  Інвертовано: {inverted}")
-                print()
+        # The whole report goes to stdout in one write
+        report = (
+            f"\n{'=' * 60}\n"
+            f"Знайдено рядків, що закінчуються на '{char}': {count}\n"
+            f"{'=' * 60}\n\n"
+        )
+        if count == 0:
+            report += "Жодного рядка не знайдено.\n"
+        sys.stdout.write(report + "".join(blocks))
         
     except Exception as e:
         print(f"Помилка при обробці файлу: {e}")